@@ -0,0 +1,83 @@
+"""Compile the YAML configs into a Python module for faster startup.
+
+The crew configuration is static between runs, so parsing YAML on every
+start is wasted work. This script parses the configs once and writes them
+out as Python literals in ``_compiled.py``, which ``ResearchCrew`` imports
+instead of parsing YAML. The module records the mtime of every source file
+and is ignored as soon as one of them changes. ``ResearchCrew`` also
+rewrites it after any start that had to fall back to YAML, so running this
+script by hand is only needed to warm the cache ahead of time.
+
+Usage:
+    pixi run compile-configs
+"""
+import ast
+import os
+import pprint
+from pathlib import Path
+import yaml
+
+CONFIG_DIR = Path(__file__).parent
+COMPILED_PATH = CONFIG_DIR / "_compiled.py"
+
+# Source files and the module-level names they are compiled to.
+SOURCES = {
+    "llm.yaml": "LLM_CONFIG",
+    "agents.yaml": "AGENT_CONFIGS",
+    "tasks.yaml": "TASK_CONFIGS",
+}
+
+def _render_literal(value) -> str:
+    """Render value as a Python literal, keeping dict keys in file order.
+
+    Raises ValueError for values YAML can produce but a plain literal cannot
+    express, such as dates or ``.inf``/``.nan``.
+    """
+    rendered = pprint.pformat(value, sort_dicts=False)
+    try:
+        ast.literal_eval(rendered)
+    except (ValueError, SyntaxError) as e:
+        raise ValueError(f"Config value cannot be compiled: {rendered}") from e
+    return rendered
+
+def render_module(configs: dict, mtimes: dict) -> str:
+    """Render parsed configs and their source mtimes as Python source."""
+    lines = [
+        '"""Compiled crew configuration. Generated; do not edit."""',
+        "",
+        f"SOURCE_MTIMES = {_render_literal(mtimes)}",
+    ]
+    for filename, name in SOURCES.items():
+        lines.append("")
+        lines.append(f"{name} = {_render_literal(configs[filename])}")
+    return "\n".join(lines) + "\n"
+
+def write_module(configs: dict, mtimes: dict, output: Path = COMPILED_PATH) -> Path:
+    """Atomically write the compiled module so readers never see a partial file."""
+    source = render_module(configs, mtimes)
+    tmp = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+    tmp.write_text(source)
+    os.replace(tmp, output)
+    return output
+
+def compile_configs(
+    config_dir: Path = CONFIG_DIR, output: Path = COMPILED_PATH
+) -> Path:
+    """Parse every config file in config_dir and write the compiled module."""
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    configs = {}
+    mtimes = {}
+    for filename in SOURCES:
+        path = config_dir / filename
+        mtimes[filename] = path.stat().st_mtime
+        with open(path, "r") as f:
+            configs[filename] = yaml.load(f, Loader=loader)
+    return write_module(configs, mtimes, output)
+
+def main():
+    """Compile the configs shipped with the package."""
+    path = compile_configs()
+    print(f"Wrote {path}")
+
+if __name__ == "__main__":
+    main()
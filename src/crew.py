@@ -1,31 +1,265 @@
 """CrewAI experiment crew configuration."""
+import asyncio
+import functools
+import importlib
+import itertools
+import queue
+import threading
 from pathlib import Path
 from crewai import Agent, Task, Crew, LLM
-import yaml
+
+# Resolved once at import so every crew shares the same config path.
+CONFIG_DIR = Path(__file__).resolve().parent / "config"
+
+# Config files in the order ResearchCrew unpacks them.
+CONFIG_FILES = ("llm.yaml", "agents.yaml", "tasks.yaml")
+
+def _load_config_documents(stamp: tuple) -> tuple:
+    """Parse each config file as a single YAML document.
+
+    ``stamp`` is a tuple of ``(path, mtime)`` pairs. Files are parsed one at
+    a time, the same way ``config/compile_configs.py`` does, so a leading
+    ``---`` is accepted and parse errors name the file they came from.
+    """
+    # Imported here so runs served from the compiled configs never load PyYAML
+    import yaml
+
+    # Prefer the libyaml-backed loader; fall back to the pure-Python one if
+    # PyYAML was built without libyaml.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    documents = []
+    for path, _ in stamp:
+        try:
+            documents.append(yaml.load(Path(path).read_text(), Loader=loader))
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML in {path}: {e}") from e
+    return tuple(documents)
+
+def _load_compiled_configs(stamp: tuple):
+    """Return the configs from ``config/_compiled.py`` if it is up to date.
+
+    The module is produced by ``config/compile_configs.py``. ``None`` is
+    returned when it has not been generated or when any source file has been
+    modified since, in which case the YAML files must be parsed instead.
+    """
+    try:
+        compiled = importlib.import_module("config._compiled")
+        source_mtimes = compiled.SOURCE_MTIMES
+        configs = compiled.LLM_CONFIG, compiled.AGENT_CONFIGS, compiled.TASK_CONFIGS
+    except Exception:
+        # A missing, broken or partial module is only a cache miss
+        return None
+    mtimes = {Path(path).name: mtime for path, mtime in stamp}
+    if source_mtimes != mtimes:
+        return None
+    return configs
+
+def _write_compiled_configs(stamp: tuple, configs: tuple):
+    """Refresh ``config/_compiled.py`` from freshly parsed configs.
+
+    Only done for the package's own config directory. This is a cache, so
+    a read-only install simply keeps parsing YAML.
+    """
+    if any(Path(path).parent != CONFIG_DIR for path, _ in stamp):
+        return
+    mtimes = {Path(path).name: mtime for path, mtime in stamp}
+    try:
+        from config.compile_configs import write_module
+
+        write_module(
+            dict(zip(CONFIG_FILES, configs)), mtimes, CONFIG_DIR / "_compiled.py"
+        )
+    except (ImportError, OSError, ValueError):
+        # Compiler unavailable, unwritable directory, or values a Python
+        # literal cannot express
+        pass
+
+def _validate_configs(llm_config: dict, agent_configs: dict, task_configs: dict):
+    """Check that the configs contain everything ResearchCrew needs."""
+    documents = zip(CONFIG_FILES, (llm_config, agent_configs, task_configs))
+    for filename, document in documents:
+        if not isinstance(document, dict):
+            raise ValueError(f"{filename} must contain a mapping")
+    if not isinstance(llm_config.get("ollama_llm"), dict):
+        raise ValueError("llm.yaml must define 'ollama_llm' as a mapping")
+    endpoints = llm_config["ollama_llm"].get("endpoints")
+    if "endpoints" in llm_config["ollama_llm"] and not (
+        isinstance(endpoints, list)
+        and endpoints
+        and all(isinstance(url, str) for url in endpoints)
+    ):
+        raise ValueError("ollama_llm.endpoints must be a non-empty list of URLs")
+    for name, config in task_configs.items():
+        if not isinstance(config, dict):
+            raise ValueError(f"Task '{name}' in tasks.yaml must be a mapping")
+        for key in ("description", "expected_output", "agent"):
+            if key not in config:
+                raise ValueError(f"Task '{name}' is missing '{key}'")
+        if config["agent"] not in agent_configs:
+            raise ValueError(f"Task '{name}' uses unknown agent '{config['agent']}'")
+
+@functools.lru_cache(maxsize=None)
+def _load_validated_configs(stamp: tuple) -> tuple:
+    """Load and validate the configs once per set of file mtimes.
+
+    Uses the compiled config module when it is up to date. Otherwise the YAML
+    files are parsed and the compiled module is refreshed for the next
+    process. The result is cached until one of the files changes, so
+    validation also runs once per version of the configs. The returned dicts
+    are shared between callers and must not be mutated.
+    """
+    configs = _load_compiled_configs(stamp)
+    if configs is not None:
+        _validate_configs(*configs)
+        return configs
+    configs = _load_config_documents(stamp)
+    _validate_configs(*configs)
+    _write_compiled_configs(stamp, configs)
+    return configs
+
+# Queued by a CrewRun's thread once kickoff has returned or raised
+_FINISHED = object()
+
+class CrewRun:
+    """A run of a copy of a crew in a background thread.
+
+    Each run gets its own ``crew.copy()`` whose tasks hand their outputs to
+    this run as they finish, so a run left behind by an abandoned caller
+    never shares tasks with the next one. Callers collect outputs with
+    ``poll`` without blocking, or block on it until the run is ``done``.
+    """
+
+    def __init__(self, crew: Crew, inputs: dict):
+        """Start running a copy of ``crew`` with ``inputs``."""
+        self.outputs = []
+        self.error = None
+        self.done = False
+        self._queue = queue.Queue()
+        # CrewAI only fills in task callbacks that are unset, so a crew-level
+        # task_callback would stick to the first run's queue
+        run_crew = crew.copy()
+        for task in run_crew.tasks:
+            task.callback = self._queue.put
+        threading.Thread(target=self._run, args=(run_crew, inputs), daemon=True).start()
+
+    def _run(self, run_crew: Crew, inputs: dict):
+        try:
+            run_crew.kickoff(inputs=inputs)
+        except Exception as e:
+            self._queue.put(e)
+        finally:
+            self._queue.put(_FINISHED)
+
+    def poll(self, block: bool = False) -> list:
+        """Return the task outputs that finished since the last poll.
+
+        With ``block``, wait until there is at least one output or the run
+        has ended. Outputs are also appended to ``outputs``; once the run has
+        ended ``done`` is set, and ``error`` holds what kickoff raised, if
+        anything.
+        """
+        outputs = []
+        while not self.done:
+            try:
+                item = self._queue.get(block=block and not outputs)
+            except queue.Empty:
+                break
+            if item is _FINISHED:
+                self.done = True
+            elif isinstance(item, Exception):
+                self.error = item
+            else:
+                outputs.append(item)
+        self.outputs.extend(outputs)
+        return outputs
+
+def kickoff_stream(crew: Crew, inputs: dict):
+    """Run a copy of ``crew`` and yield each task's output as it finishes.
+
+    Blocks between outputs; see ``CrewRun`` for a run that can be polled.
+    Errors from the run are raised here once the outputs before them have
+    been yielded.
+    """
+    run = CrewRun(crew, inputs)
+    separator = ""
+    while not run.done:
+        for output in run.poll(block=True):
+            yield f"{separator}{output}"
+            separator = "\n\n"
+    if run.error is not None:
+        raise run.error
 
 class ResearchCrew:
     """Crew for AI research and content creation."""
 
     def __init__(self):
-        """Initialize the crew with configurations."""
-        self.config_dir = Path(__file__).parent / "config"
-        self.llm = self._load_llm()
-        self.agents = self._load_agents()
-        self.tasks = self._load_tasks()
-
-    def _load_llm(self):
-        """Load LLM configuration from YAML."""
-        with open(self.config_dir / "llm.yaml", "r") as f:
-            config = yaml.safe_load(f)
-            return LLM(**config['ollama_llm'])
+        """Initialize the crew; configs, LLM, agents and tasks load on first use."""
+        self.config_dir = CONFIG_DIR
+
+    @functools.cached_property
+    def _configs(self) -> tuple:
+        """The (llm, agents, tasks) configs, loaded on first access."""
+        return self._load_configs()
+
+    @property
+    def llm_config(self) -> dict:
+        """LLM settings from llm.yaml."""
+        return self._configs[0]
+
+    @property
+    def agent_configs(self) -> dict:
+        """Agent definitions from agents.yaml."""
+        return self._configs[1]
+
+    @property
+    def task_configs(self) -> dict:
+        """Task definitions from tasks.yaml."""
+        return self._configs[2]
+
+    @functools.cached_property
+    def llms(self) -> list:
+        """One LLM per configured endpoint, built on first access."""
+        return self._load_llms()
+
+    @property
+    def llm(self) -> LLM:
+        """The LLM used by the crew's own agents (the first endpoint)."""
+        return self.llms[0]
+
+    @functools.cached_property
+    def agents(self) -> dict:
+        """Agents keyed by name, built on first access."""
+        return self._load_agents()
+
+    @functools.cached_property
+    def tasks(self) -> list:
+        """Tasks in execution order, built on first access."""
+        return self._load_tasks()
+
+    def _load_configs(self) -> tuple:
+        """Load all config files, reusing the parsed result while unchanged."""
+        paths = [self.config_dir / name for name in CONFIG_FILES]
+        stamp = tuple((str(path), path.stat().st_mtime) for path in paths)
+        return _load_validated_configs(stamp)
+
+    def _load_llms(self):
+        """Load LLM configuration from YAML.
+
+        ``ollama_llm.endpoints`` may list several servers; one LLM is built per
+        endpoint with the remaining settings shared. Without it a single LLM
+        is built from ``base_url``.
+        """
+        config = dict(self.llm_config['ollama_llm'])
+        endpoints = config.pop('endpoints', None)
+        if not endpoints:
+            return [LLM(**config)]
+        config.pop('base_url', None)
+        return [LLM(**config, base_url=endpoint) for endpoint in endpoints]
 
     def _load_agents(self):
         """Load agent configurations from YAML."""
-        with open(self.config_dir / "agents.yaml", "r") as f:
-            configs = yaml.safe_load(f)
-        
         agents = {}
-        for name, config in configs.items():
+        for name, config in self.agent_configs.items():
             agents[name] = Agent(
                 **config,
                 llm=self.llm
@@ -34,11 +268,8 @@ class ResearchCrew:
 
     def _load_tasks(self):
         """Load task configurations from YAML."""
-        with open(self.config_dir / "tasks.yaml", "r") as f:
-            configs = yaml.safe_load(f)
-        
         tasks = []
-        for name, config in configs.items():
+        for name, config in self.task_configs.items():
             task = Task(
                 description=config['description'],
                 expected_output=config['expected_output'],
@@ -47,10 +278,45 @@ class ResearchCrew:
             tasks.append(task)
         return tasks
 
-    def crew(self) -> Crew:
-        """Create and return the configured crew."""
+    @functools.cached_property
+    def _crew(self) -> Crew:
+        """The configured crew, built on first access."""
         return Crew(
             agents=list(self.agents.values()),
             tasks=self.tasks,
             verbose=True
-        ) 
\ No newline at end of file
+        )
+
+    def crew(self) -> Crew:
+        """Return the configured crew.
+
+        Agents and tasks do not depend on the research topic: CrewAI fills in
+        the ``{topic}`` placeholders from tasks.yaml at kickoff time, so one
+        crew serves every topic via ``kickoff(inputs={"topic": ...})``.
+        """
+        return self._crew
+
+    async def process_batch(self, topics: list, max_concurrency: int = 4) -> list:
+        """Research several topics concurrently and return results in order.
+
+        Each topic runs on its own copy of the crew, since a crew records task
+        outputs while it runs. Topics are assigned to the configured LLM
+        endpoints round-robin, and at most ``max_concurrency`` topics are in
+        flight at once so the LLM servers are not flooded. A topic that fails
+        has its exception in its place in the results, so the other topics'
+        results are still returned.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def research(topic: str, llm: LLM):
+            async with semaphore:
+                crew = self.crew().copy()
+                for agent in crew.agents:
+                    agent.llm = llm
+                return await crew.kickoff_async(inputs={"topic": topic})
+
+        llms = itertools.cycle(self.llms)
+        return await asyncio.gather(
+            *(research(topic, next(llms)) for topic in topics),
+            return_exceptions=True,
+        )
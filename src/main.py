@@ -1,15 +1,29 @@
 """Main entry point for the CrewAI experiment."""
+import asyncio
+import sys
 from crew import ResearchCrew
 
+# Topic researched when none is given on the command line
+DEFAULT_TOPIC = "artificial intelligence"
+
 def main():
-    """Run the CrewAI experiment."""
+    """Run the CrewAI experiment.
+
+    Topics are taken from the command line; several topics are researched
+    concurrently.
+    """
+    topics = sys.argv[1:] or [DEFAULT_TOPIC]
+
     # Initialize and run the crew
-    crew = ResearchCrew().crew()
-    result = crew.kickoff()
+    results = asyncio.run(ResearchCrew().process_batch(topics))
 
     # Display the final output
-    print("\nFinal Result:")
-    print(result)
+    for topic, result in zip(topics, results):
+        if isinstance(result, Exception):
+            print(f"\nFailed ({topic}): {result}")
+            continue
+        print(f"\nFinal Result ({topic}):")
+        print(result)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
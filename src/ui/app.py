@@ -1,37 +1,94 @@
 """Streamlit chat interface for CrewAI experiment."""
+import collections
+import itertools
+from typing import TYPE_CHECKING
 import streamlit as st
-from crew import ResearchCrew
+
+# crew pulls in CrewAI and LiteLLM, which take seconds to import. It is
+# imported on first use so the page renders before that cost is paid.
+if TYPE_CHECKING:
+    from crew import CrewRun, ResearchCrew
+
+# Chat history kept per session; the oldest messages are dropped beyond this
+MAX_MESSAGES = 200
+# Only the most recent messages are rendered on each rerun
+MAX_DISPLAYED_MESSAGES = 50
+# How often a running research request is checked for new output, in seconds
+POLL_INTERVAL = 0.5
+
+@st.cache_resource
+def get_research_crew() -> "ResearchCrew":
+    """Build the research crew (configs, LLM, agents) once per server process."""
+    from crew import ResearchCrew
+
+    return ResearchCrew()
 
 def initialize_session_state():
     """Initialize session state variables."""
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
+    st.session_state.setdefault("messages", collections.deque(maxlen=MAX_MESSAGES))
     if "crew" not in st.session_state:
-        st.session_state.crew = ResearchCrew().crew()
+        # Sessions share the cached crew; kickoff_stream runs each message on
+        # its own copy, so runs never share task outputs
+        st.session_state.crew = get_research_crew().crew()
 
 def display_chat_messages():
-    """Display all messages in the chat."""
-    for message in st.session_state.messages:
+    """Display the most recent messages in the chat."""
+    messages = st.session_state.messages
+    hidden = max(len(messages) - MAX_DISPLAYED_MESSAGES, 0)
+    if hidden:
+        st.caption(f"{hidden} earlier messages hidden")
+    for message in itertools.islice(messages, hidden, None):
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
 
 def process_user_input(user_input: str):
-    """Process user input and get AI response."""
+    """Start researching the user's input in the background.
+
+    The crew runs in its own thread and ``show_research_progress`` picks up
+    the result, so the page stays responsive while the research runs.
+    """
+    from crew import CrewRun
+
     if user_input:
         # Add user message to chat
         st.session_state.messages.append({"role": "user", "content": user_input})
-        
-        # Show processing message
+
+        try:
+            st.session_state.run = CrewRun(
+                st.session_state.crew, {"topic": user_input}
+            )
+        except Exception as e:
+            error_msg = f"Error: {str(e)}"
+            st.session_state.messages.append({"role": "system", "content": f"❌ {error_msg}"})
+        # Rerun so the new message shows and the chat input is disabled
+        st.rerun()
+
+@st.fragment(run_every=POLL_INTERVAL)
+def show_research_progress():
+    """Show the running research and add its result to the chat when done.
+
+    Reruns on its own every ``POLL_INTERVAL`` seconds without rerunning the
+    rest of the page.
+    """
+    run: "CrewRun" = st.session_state.run
+    run.poll()
+    if not run.done:
+        # Show each task's output from CrewAI as soon as it is ready
         with st.chat_message("assistant"):
-            with st.spinner("Researching..."):
-                try:
-                    # Get response from CrewAI
-                    response = st.session_state.crew.kickoff()
-                    # Add AI response to chat
-                    st.session_state.messages.append({"role": "assistant", "content": response})
-                except Exception as e:
-                    error_msg = f"Error: {str(e)}"
-                    st.session_state.messages.append({"role": "system", "content": f"❌ {error_msg}"})
+            st.caption("Researching...")
+            st.markdown("\n\n".join(str(output) for output in run.outputs))
+        return
+
+    del st.session_state.run
+    if run.error is None:
+        # Add AI response to chat
+        response = "\n\n".join(str(output) for output in run.outputs)
+        st.session_state.messages.append({"role": "assistant", "content": response})
+    else:
+        error_msg = f"Error: {str(run.error)}"
+        st.session_state.messages.append({"role": "system", "content": f"❌ {error_msg}"})
+    # Rerun the whole page to show the result and re-enable the chat input
+    st.rerun()
 
 def main():
     """Main function to run the Streamlit app."""
@@ -46,8 +103,15 @@ def main():
     # Display chat messages
     display_chat_messages()
 
+    # Follow the research started by an earlier message
+    researching = "run" in st.session_state
+    if researching:
+        show_research_progress()
+
     # Chat input
-    if user_input := st.chat_input("What would you like me to research?"):
+    if user_input := st.chat_input(
+        "What would you like me to research?", disabled=researching
+    ):
         process_user_input(user_input)
 
 if __name__ == "__main__":
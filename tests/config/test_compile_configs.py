@@ -0,0 +1,46 @@
+"""Tests for the YAML config compiler."""
+import datetime
+import runpy
+
+import pytest
+
+from src.config.compile_configs import SOURCES, compile_configs, render_module
+
+def test_compile_configs_round_trips_yaml(tmp_path):
+    """Test that the compiled module holds the parsed configs and mtimes."""
+    for filename in SOURCES:
+        (tmp_path / filename).write_text(f"{filename.split('.')[0]}:\n  key: value\n")
+    output = compile_configs(tmp_path, tmp_path / "_compiled.py")
+
+    compiled = runpy.run_path(str(output))
+
+    assert compiled["LLM_CONFIG"] == {"llm": {"key": "value"}}
+    assert compiled["AGENT_CONFIGS"] == {"agents": {"key": "value"}}
+    assert compiled["TASK_CONFIGS"] == {"tasks": {"key": "value"}}
+    assert compiled["SOURCE_MTIMES"] == {
+        filename: (tmp_path / filename).stat().st_mtime for filename in SOURCES
+    }
+
+def test_compile_configs_keeps_file_order(tmp_path):
+    """Test that tasks keep their YAML order rather than being sorted."""
+    for filename in SOURCES:
+        (tmp_path / filename).write_text("{}\n")
+    (tmp_path / "tasks.yaml").write_text(
+        "writing_task:\n  agent: writer\nanalysis_task:\n  agent: researcher\n"
+    )
+    output = compile_configs(tmp_path, tmp_path / "_compiled.py")
+
+    compiled = runpy.run_path(str(output))
+
+    assert list(compiled["TASK_CONFIGS"]) == ["writing_task", "analysis_task"]
+
+@pytest.mark.parametrize(
+    "value", [float("inf"), float("nan"), datetime.date(2024, 1, 1)]
+)
+def test_render_module_rejects_non_literal_values(value):
+    """Test that values without a plain literal form are not compiled."""
+    configs = {filename: {} for filename in SOURCES}
+    configs["llm.yaml"] = {"ollama_llm": {"max_rpm": value}}
+
+    with pytest.raises(ValueError, match="cannot be compiled"):
+        render_module(configs, {})
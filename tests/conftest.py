@@ -5,4 +5,11 @@ from pathlib import Path
 
 # Add src to Python path
 src_path = Path(__file__).parent.parent / "src"
-sys.path.append(str(src_path)) 
\ No newline at end of file
+sys.path.append(str(src_path)) 
+
+@pytest.fixture(autouse=True)
+def no_compiled_config_writes(monkeypatch):
+    """Keep tests that build a real crew from writing src/config/_compiled.py."""
+    import crew
+
+    monkeypatch.setattr(crew, "_write_compiled_configs", lambda stamp, configs: None)
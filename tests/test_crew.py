@@ -0,0 +1,334 @@
+"""Tests for the research crew and its configuration loader."""
+import asyncio
+import os
+import runpy
+import sys
+import threading
+import types
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from crew import (
+    CrewRun,
+    ResearchCrew,
+    _load_compiled_configs,
+    _load_config_documents,
+    _load_validated_configs,
+    _validate_configs,
+    _write_compiled_configs,
+    kickoff_stream,
+)
+
+def _stamp(*paths):
+    """Build the (path, mtime) cache key for the given files."""
+    return tuple((str(path), path.stat().st_mtime) for path in paths)
+
+@pytest.fixture
+def config_files(tmp_path):
+    """Write a minimal llm/agents/tasks config set."""
+    llm_file = tmp_path / "llm.yaml"
+    llm_file.write_text("ollama_llm:\n  model: ollama/test\n")
+    agents_file = tmp_path / "agents.yaml"
+    agents_file.write_text("researcher:\n  role: Research Analyst\n")
+    tasks_file = tmp_path / "tasks.yaml"
+    tasks_file.write_text(
+        "research_task:\n"
+        "  description: Research {topic}\n"
+        "  expected_output: An overview\n"
+        "  agent: researcher\n"
+    )
+    return llm_file, agents_file, tasks_file
+
+def test_load_config_documents_parses_each_file(config_files):
+    """Test that each file becomes one document, in order."""
+    llm_config, agent_configs, task_configs = _load_config_documents(
+        _stamp(*config_files)
+    )
+
+    assert llm_config == {"ollama_llm": {"model": "ollama/test"}}
+    assert agent_configs == {"researcher": {"role": "Research Analyst"}}
+    assert task_configs["research_task"]["agent"] == "researcher"
+
+def test_load_config_documents_rejects_multi_document_file(config_files):
+    """Test that a file with its own document separator is rejected."""
+    llm_file, agents_file, tasks_file = config_files
+    agents_file.write_text("researcher: {}\n---\nwriter: {}\n")
+
+    with pytest.raises(ValueError):
+        _load_config_documents(_stamp(llm_file, agents_file, tasks_file))
+
+def test_load_config_documents_accepts_leading_document_marker(config_files):
+    """Test that a file opening with an explicit '---' is still one document."""
+    llm_file, agents_file, tasks_file = config_files
+    agents_file.write_text("---\nresearcher:\n  role: Research Analyst\n")
+
+    _, agent_configs, _ = _load_config_documents(
+        _stamp(llm_file, agents_file, tasks_file)
+    )
+
+    assert agent_configs == {"researcher": {"role": "Research Analyst"}}
+
+def test_load_config_documents_names_the_broken_file(config_files):
+    """Test that parse errors point at the file that failed."""
+    llm_file, agents_file, tasks_file = config_files
+    tasks_file.write_text("research_task: [unclosed\n")
+
+    with pytest.raises(ValueError, match="tasks.yaml"):
+        _load_config_documents(_stamp(llm_file, agents_file, tasks_file))
+
+def test_load_validated_configs_reuses_parsed_config(config_files):
+    """Test that unchanged files are parsed only once."""
+    stamp = _stamp(*config_files)
+
+    assert _load_validated_configs(stamp) is _load_validated_configs(stamp)
+
+def test_load_validated_configs_reloads_on_mtime_change(config_files):
+    """Test that a modified file is parsed again."""
+    llm_file = config_files[0]
+    old_llm, _, _ = _load_validated_configs(_stamp(*config_files))
+
+    llm_file.write_text("ollama_llm:\n  model: ollama/new\n")
+    stat = llm_file.stat()
+    os.utime(llm_file, (stat.st_atime, stat.st_mtime + 1))
+    new_llm, _, _ = _load_validated_configs(_stamp(*config_files))
+
+    assert old_llm["ollama_llm"]["model"] == "ollama/test"
+    assert new_llm["ollama_llm"]["model"] == "ollama/new"
+
+def test_validate_configs_rejects_missing_task_key():
+    """Test that a task without an expected output is rejected."""
+    tasks = {"research_task": {"description": "Research", "agent": "researcher"}}
+
+    with pytest.raises(ValueError, match="expected_output"):
+        _validate_configs({"ollama_llm": {}}, {"researcher": {}}, tasks)
+
+def test_validate_configs_rejects_unknown_agent():
+    """Test that a task assigned to an undefined agent is rejected."""
+    tasks = {
+        "research_task": {
+            "description": "Research",
+            "expected_output": "An overview",
+            "agent": "editor",
+        }
+    }
+
+    with pytest.raises(ValueError, match="editor"):
+        _validate_configs({"ollama_llm": {}}, {"researcher": {}}, tasks)
+
+@pytest.mark.parametrize(
+    "configs, filename",
+    [
+        (({"ollama_llm": {}}, {}, None), "tasks.yaml"),
+        (({"ollama_llm": {}}, ["researcher"], {}), "agents.yaml"),
+        (({"ollama_llm": "x"}, {}, {}), "llm.yaml"),
+        (({"ollama_llm": {}}, {}, {"research_task": "x"}), "tasks.yaml"),
+    ],
+)
+def test_validate_configs_rejects_non_mapping_documents(configs, filename):
+    """Test that empty or non-mapping configs fail with a ValueError."""
+    with pytest.raises(ValueError, match=filename):
+        _validate_configs(*configs)
+
+@pytest.mark.parametrize(
+    "endpoints", ["http://localhost:11434", [], None, ["http://a:11434", 11434]]
+)
+def test_validate_configs_rejects_malformed_endpoints(endpoints):
+    """Test that endpoints must be a non-empty list of URL strings."""
+    llm_config = {"ollama_llm": {"endpoints": endpoints}}
+
+    with pytest.raises(ValueError, match="endpoints"):
+        _validate_configs(llm_config, {}, {})
+
+@pytest.fixture
+def compiled_module(monkeypatch):
+    """Install a fake compiled config module."""
+    module = types.ModuleType("config._compiled")
+    module.SOURCE_MTIMES = {"llm.yaml": 1.0}
+    module.LLM_CONFIG = {"ollama_llm": {}}
+    module.AGENT_CONFIGS = {}
+    module.TASK_CONFIGS = {}
+    monkeypatch.setitem(sys.modules, "config._compiled", module)
+    return module
+
+def test_load_compiled_configs_uses_fresh_module(compiled_module):
+    """Test that compiled configs are used while the sources are unchanged."""
+    configs = _load_compiled_configs((("/config/llm.yaml", 1.0),))
+
+    assert configs == ({"ollama_llm": {}}, {}, {})
+
+def test_load_compiled_configs_ignores_stale_module(compiled_module):
+    """Test that compiled configs are ignored once a source file changes."""
+    assert _load_compiled_configs((("/config/llm.yaml", 2.0),)) is None
+
+def test_process_batch_runs_each_topic_on_a_crew_copy():
+    """Test that batch results come back in topic order."""
+    research_crew = object.__new__(ResearchCrew)
+    research_crew.llms = [MagicMock()]
+    crew_copy = MagicMock()
+    crew_copy.kickoff_async = AsyncMock(side_effect=lambda inputs: inputs["topic"])
+    research_crew._crew = MagicMock(**{"copy.return_value": crew_copy})
+
+    results = asyncio.run(
+        research_crew.process_batch(["a", "b", "c"], max_concurrency=2)
+    )
+
+    assert results == ["a", "b", "c"]
+    assert research_crew._crew.copy.call_count == 3
+
+def test_process_batch_keeps_results_when_a_topic_fails():
+    """Test that one failing topic does not discard the others' results."""
+    research_crew = object.__new__(ResearchCrew)
+    research_crew.llms = [MagicMock()]
+    error = RuntimeError("LLM unavailable")
+
+    async def kickoff_async(inputs):
+        if inputs["topic"] == "b":
+            raise error
+        return inputs["topic"]
+
+    crew_copy = MagicMock()
+    crew_copy.kickoff_async = AsyncMock(side_effect=kickoff_async)
+    research_crew._crew = MagicMock(**{"copy.return_value": crew_copy})
+
+    results = asyncio.run(research_crew.process_batch(["a", "b", "c"]))
+
+    assert results == ["a", error, "c"]
+
+# The conftest fixture stubs out crew._write_compiled_configs; these tests
+# call the real function imported above.
+
+def test_write_compiled_configs_leaves_foreign_dirs_uncompiled(
+    config_files, monkeypatch
+):
+    """Test that only the package's own configs refresh the compiled module."""
+    write_module = MagicMock()
+    monkeypatch.setattr("config.compile_configs.write_module", write_module)
+    stamp = _stamp(*config_files)
+
+    _write_compiled_configs(stamp, _load_config_documents(stamp))
+
+    write_module.assert_not_called()
+
+def test_write_compiled_configs_compiles_own_dir(config_files, monkeypatch):
+    """Test that the package's own configs are written to the compiled module."""
+    config_dir = config_files[0].parent
+    monkeypatch.setattr("crew.CONFIG_DIR", config_dir)
+    stamp = _stamp(*config_files)
+
+    _write_compiled_configs(stamp, _load_config_documents(stamp))
+
+    compiled = runpy.run_path(str(config_dir / "_compiled.py"))
+    assert compiled["SOURCE_MTIMES"] == {
+        path.name: path.stat().st_mtime for path in config_files
+    }
+    assert compiled["TASK_CONFIGS"]["research_task"]["agent"] == "researcher"
+
+def test_write_compiled_configs_ignores_missing_compiler(config_files, monkeypatch):
+    """Test that an unimportable compiler only skips the cache refresh."""
+    config_dir = config_files[0].parent
+    monkeypatch.setattr("crew.CONFIG_DIR", config_dir)
+    monkeypatch.setitem(sys.modules, "config.compile_configs", None)
+    stamp = _stamp(*config_files)
+
+    _write_compiled_configs(stamp, _load_config_documents(stamp))
+
+    assert not (config_dir / "_compiled.py").exists()
+
+def test_process_batch_spreads_topics_across_endpoints():
+    """Test that each topic's agents use the next LLM endpoint in turn."""
+    research_crew = object.__new__(ResearchCrew)
+    research_crew.llms = ["llm-a", "llm-b"]
+    copies = []
+
+    def copy_crew():
+        crew_copy = MagicMock(agents=[MagicMock(), MagicMock()])
+        crew_copy.kickoff_async = AsyncMock(return_value="done")
+        copies.append(crew_copy)
+        return crew_copy
+
+    research_crew._crew = MagicMock(**{"copy.side_effect": copy_crew})
+
+    asyncio.run(research_crew.process_batch(["a", "b", "c"]))
+
+    assigned = [{agent.llm for agent in crew_copy.agents} for crew_copy in copies]
+    assert assigned == [{"llm-a"}, {"llm-b"}, {"llm-a"}]
+
+class _StubCrew:
+    """Crew stand-in whose tasks report outputs through their callbacks."""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.tasks = [types.SimpleNamespace(callback=None) for _ in outputs]
+
+    def copy(self):
+        return _StubCrew(self.outputs)
+
+    def kickoff(self, inputs):
+        for task, output in zip(self.tasks, self.outputs):
+            task.callback(output.format(**inputs))
+
+def test_kickoff_stream_yields_each_task_output():
+    """Test that task outputs are streamed in order, separated by blank lines."""
+    crew = _StubCrew(["Research for {topic}", "Summary"])
+
+    assert list(kickoff_stream(crew, {"topic": "AI"})) == [
+        "Research for AI",
+        "\n\nSummary",
+    ]
+
+def test_kickoff_stream_streams_every_run_of_a_crew():
+    """Test that later runs of the same crew stream their own outputs."""
+    crew = _StubCrew(["Research for {topic}"])
+
+    first = list(kickoff_stream(crew, {"topic": "AI"}))
+    second = list(kickoff_stream(crew, {"topic": "ML"}))
+
+    assert (first, second) == (["Research for AI"], ["Research for ML"])
+    assert crew.tasks[0].callback is None
+
+def test_crew_run_poll_does_not_block():
+    """Test that polling a running crew returns at once with what is ready."""
+    release = threading.Event()
+    crew = MagicMock()
+    run_crew = crew.copy.return_value
+    run_crew.tasks = [MagicMock(), MagicMock()]
+
+    def kickoff(inputs):
+        run_crew.tasks[0].callback("Research")
+        release.wait()
+        run_crew.tasks[1].callback("Summary")
+
+    run_crew.kickoff.side_effect = kickoff
+
+    run = CrewRun(crew, {"topic": "AI"})
+    assert run.poll(block=True) == ["Research"]
+    assert (run.poll(), run.done) == ([], False)
+
+    release.set()
+    while not run.done:
+        run.poll(block=True)
+    assert run.outputs == ["Research", "Summary"]
+    assert run.error is None
+
+def test_kickoff_stream_raises_crew_errors():
+    """Test that an error during the run reaches the consumer."""
+    crew = MagicMock()
+    crew.copy.return_value.kickoff.side_effect = RuntimeError("LLM unavailable")
+
+    with pytest.raises(RuntimeError, match="LLM unavailable"):
+        list(kickoff_stream(crew, {"topic": "AI"}))
+
+def test_load_compiled_configs_treats_incomplete_module_as_miss(compiled_module):
+    """Test that a module missing a config name is ignored."""
+    del compiled_module.TASK_CONFIGS
+
+    assert _load_compiled_configs((("/config/llm.yaml", 1.0),)) is None
+
+def test_load_compiled_configs_treats_broken_module_as_miss(monkeypatch):
+    """Test that a module that fails to import is ignored."""
+    monkeypatch.setattr(
+        "crew.importlib.import_module", MagicMock(side_effect=NameError("inf"))
+    )
+
+    assert _load_compiled_configs((("/config/llm.yaml", 1.0),)) is None
@@ -1,5 +1,6 @@
 """Tests for the Streamlit chat interface."""
 import pytest
+import threading
 from unittest.mock import MagicMock, patch
 import sys
 from pathlib import Path
@@ -7,7 +8,13 @@ from pathlib import Path
 # Add src directory to Python path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
-from src.ui.app import initialize_session_state, process_user_input
+from src.ui.app import (
+    MAX_DISPLAYED_MESSAGES,
+    display_chat_messages,
+    initialize_session_state,
+    process_user_input,
+    show_research_progress,
+)
 
 @pytest.fixture
 def mock_streamlit():
@@ -25,31 +32,95 @@ def test_initialize_session_state(mock_streamlit):
     assert hasattr(mock_streamlit.session_state, "messages")
     assert hasattr(mock_streamlit.session_state, "crew")
 
+def test_initialize_session_state_uses_shared_crew(mock_streamlit):
+    """Test that sessions use the cached crew without cloning it."""
+    with patch("src.ui.app.get_research_crew") as mock_get_research_crew:
+        initialize_session_state()
+
+    shared_crew = mock_get_research_crew.return_value.crew.return_value
+    assert mock_streamlit.session_state.crew is shared_crew
+    shared_crew.copy.assert_not_called()
+
+def test_display_chat_messages_renders_only_recent(mock_streamlit):
+    """Test that long histories only render the most recent messages."""
+    mock_streamlit.session_state.messages = [
+        {"role": "user", "content": f"Message {i}"}
+        for i in range(MAX_DISPLAYED_MESSAGES + 5)
+    ]
+
+    display_chat_messages()
+
+    assert mock_streamlit.chat_message.call_count == MAX_DISPLAYED_MESSAGES
+    mock_streamlit.caption.assert_called_once_with("5 earlier messages hidden")
+    mock_streamlit.markdown.assert_called_with(
+        f"Message {MAX_DISPLAYED_MESSAGES + 4}"
+    )
+
+def _wait_for(run):
+    """Block until a background crew run has finished."""
+    while not run.done:
+        run.poll(block=True)
+
 def test_process_user_input_success(mock_streamlit):
     """Test successful processing of user input."""
     # Mock successful response
-    mock_streamlit.session_state.crew.kickoff.return_value = "Test response"
-    
-    # Process input
+    run_crew = mock_streamlit.session_state.crew.copy.return_value
+    run_crew.tasks = [MagicMock()]
+    run_crew.kickoff.side_effect = (
+        lambda inputs: run_crew.tasks[0].callback("Test response")
+    )
+
+    # Process input; the research runs in the background
     process_user_input("Test input")
-    
+    assert len(mock_streamlit.session_state.messages) == 1
+    _wait_for(mock_streamlit.session_state.run)
+    show_research_progress()
+
     # Check messages were added
     assert len(mock_streamlit.session_state.messages) == 2
     assert mock_streamlit.session_state.messages[0]["role"] == "user"
     assert mock_streamlit.session_state.messages[0]["content"] == "Test input"
     assert mock_streamlit.session_state.messages[1]["role"] == "assistant"
     assert mock_streamlit.session_state.messages[1]["content"] == "Test response"
+    assert not hasattr(mock_streamlit.session_state, "run")
+    run_crew.kickoff.assert_called_once_with(inputs={"topic": "Test input"})
 
 def test_process_user_input_error(mock_streamlit):
     """Test error handling in user input processing."""
     # Mock error response
-    mock_streamlit.session_state.crew.kickoff.side_effect = Exception("Test error")
-    
+    run_crew = mock_streamlit.session_state.crew.copy.return_value
+    run_crew.kickoff.side_effect = Exception("Test error")
+
     # Process input
     process_user_input("Test input")
-    
+    _wait_for(mock_streamlit.session_state.run)
+    show_research_progress()
+
     # Check error message was added
     assert len(mock_streamlit.session_state.messages) == 2
     assert mock_streamlit.session_state.messages[0]["role"] == "user"
     assert mock_streamlit.session_state.messages[1]["role"] == "system"
-    assert "Error: Test error" in mock_streamlit.session_state.messages[1]["content"] 
\ No newline at end of file
+    assert "Error: Test error" in mock_streamlit.session_state.messages[1]["content"]
+
+def test_show_research_progress_while_running(mock_streamlit):
+    """Test that finished task outputs show before the run completes."""
+    release = threading.Event()
+    run_crew = mock_streamlit.session_state.crew.copy.return_value
+    run_crew.tasks = [MagicMock()]
+
+    def kickoff(inputs):
+        run_crew.tasks[0].callback("Research")
+        release.wait()
+
+    run_crew.kickoff.side_effect = kickoff
+    process_user_input("Test input")
+    run = mock_streamlit.session_state.run
+    run.poll(block=True)
+
+    show_research_progress()
+
+    mock_streamlit.markdown.assert_called_with("Research")
+    assert len(mock_streamlit.session_state.messages) == 1
+    assert mock_streamlit.session_state.run is run
+    release.set()
+    _wait_for(run)